@@ -4,14 +4,40 @@ Emily Tools - Extensible MCP Server
 Main entry point for the Emily Tools MCP server with all tools registered.
 """
 
+import asyncio
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from mcp.server.fastmcp import Context, FastMCP
 
-from tools import *
+async def _initialize_tools(mcp: FastMCP, data_dir: Path) -> None:
+    """Initialize all tools on a single event loop."""
+    # Tool modules are imported here so importing main stays cheap
+    from tools.async_tasks.async_tasks import AsyncTasksTool
+    from tools.calendar.calendar import CalendarTool
+    from tools.handoff.handoff import HandoffTool
+    from tools.knowledgebase.knowledgebase import KnowledgebaseTool
+    from tools.memory_graph.memory_graph import MemoryGraphTool
+    from tools.time_service.time_service import TimeServiceTool
+    from tools.todo.todo import TodoTool
 
+    await asyncio.gather(
+        TodoTool(data_dir).initialize(mcp),
+        CalendarTool(data_dir).initialize(mcp),
+        KnowledgebaseTool(data_dir).initialize(mcp),
+        AsyncTasksTool(data_dir).initialize(mcp),
+        TimeServiceTool(data_dir).initialize(mcp),
+        MemoryGraphTool(data_dir).initialize(mcp),
+        HandoffTool(data_dir).initialize(mcp),
+    )
+
+@lru_cache(maxsize=1)
 def create_mcp_server() -> FastMCP:
-    """Create and configure the MCP server with all tools."""
+    """Create and configure the MCP server with all tools.
+
+    The server is built once per process; later calls return the same instance.
+    """
     
     # Create data directory
     data_dir = Path("data")
@@ -21,22 +47,19 @@ def create_mcp_server() -> FastMCP:
     mcp = FastMCP("Emily Tools")
 
     # Initialize tools (this will also register them with MCP)
-    import asyncio
-    asyncio.run(TodoTool(data_dir).initialize(mcp))
-    asyncio.run(CalendarTool(data_dir).initialize(mcp))
-    asyncio.run(KnowledgebaseTool(data_dir).initialize(mcp))
-    asyncio.run(AsyncTasksTool(data_dir).initialize(mcp))
-    asyncio.run(TimeServiceTool(data_dir).initialize(mcp))
-    asyncio.run(MemoryGraphTool(data_dir).initialize(mcp))
-    asyncio.run(HandoffTool(data_dir).initialize(mcp))
+    asyncio.run(_initialize_tools(mcp, data_dir))
     
     return mcp
 
-# Expose a global MCP server object for MCP CLI compatibility
-mcp = create_mcp_server()
+def __getattr__(name: str) -> Any:
+    # Expose a global MCP server object for MCP CLI compatibility, built on
+    # first access to `main.mcp` rather than when the module is imported
+    if name == "mcp":
+        return create_mcp_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def main():
-    mcp.run()
+    create_mcp_server().run()
 
 if __name__ == "__main__":
     main()
@@ -1,15 +1,33 @@
 """
 Tools package for Emily Tools MCP server.
+
+Tool classes are imported on first access, so importing one tool does not
+load every other tool module.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseTool
-from .todo.todo import TodoTool
-from .calendar.calendar import CalendarTool
-from .knowledgebase.knowledgebase import KnowledgebaseTool
-from .async_tasks.async_tasks import AsyncTasksTool
-from .time_service.time_service import TimeServiceTool
-from .memory_graph.memory_graph import MemoryGraphTool
-from .handoff.handoff import HandoffTool
+
+if TYPE_CHECKING:
+    from .todo.todo import TodoTool
+    from .calendar.calendar import CalendarTool
+    from .knowledgebase.knowledgebase import KnowledgebaseTool
+    from .async_tasks.async_tasks import AsyncTasksTool
+    from .time_service.time_service import TimeServiceTool
+    from .memory_graph.memory_graph import MemoryGraphTool
+    from .handoff.handoff import HandoffTool
+
+_TOOL_MODULES = {
+    "TodoTool": ".todo.todo",
+    "CalendarTool": ".calendar.calendar",
+    "KnowledgebaseTool": ".knowledgebase.knowledgebase",
+    "AsyncTasksTool": ".async_tasks.async_tasks",
+    "TimeServiceTool": ".time_service.time_service",
+    "MemoryGraphTool": ".memory_graph.memory_graph",
+    "HandoffTool": ".handoff.handoff",
+}
 
 __all__ = [
     "BaseTool",
@@ -20,4 +38,12 @@ __all__ = [
     "TimeServiceTool",
     "MemoryGraphTool",
     "HandoffTool",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _TOOL_MODULES:
+        tool_class = getattr(import_module(_TOOL_MODULES[name], __name__), name)
+        globals()[name] = tool_class
+        return tool_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,13 +5,13 @@ Async Tasks tool for Emily Tools MCP server.
 import asyncio
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
 from ..base import BaseTool
-import json
 
 
 class TaskStatus(str, Enum):
@@ -78,19 +78,23 @@ class AsyncTasksTool(BaseTool):
     def _read_tasks(self) -> List[AsyncTask]:
         if not self.data_file.exists():
             return []
-        with open(self.data_file, 'r') as f:
-            return [AsyncTask(**json.loads(line)) for line in f if line.strip()]
+        return self._cached_read(self._load_tasks)
+
+    def _load_tasks(self) -> List[AsyncTask]:
+        lines = self._read_lines()
+        return [AsyncTask.model_validate_json(line) for line in lines if line and not line.isspace()]
 
     def _write_tasks(self, tasks: List[AsyncTask]):
-        with open(self.data_file, 'w') as f:
-            for task in tasks:
-                f.write(task.json() + '\n')
+        content = ''.join(task.json() + '\n' for task in tasks)
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self._invalidate_cache()
 
     def create_task(self, name: str, command: str, arguments: Dict[str, Any] = {},
                    description: Optional[str] = None, priority: TaskPriority = TaskPriority.NORMAL,
                    tags: List[str] = []) -> AsyncTask:
         tasks = self._read_tasks()
-        new_id = max([t.id for t in tasks if t.id is not None] + [0]) + 1
+        new_id = max((t.id for t in tasks if t.id is not None), default=0) + 1
         task = AsyncTask(
             id=new_id,
             name=name,
@@ -101,15 +105,16 @@ class AsyncTasksTool(BaseTool):
             tags=tags,
             created_at=datetime.now(),
         )
-        with open(self.data_file, 'a') as f:
+        with open(self.data_file, 'a', encoding='utf-8') as f:
             f.write(task.json() + '\n')
+        self._invalidate_cache()
         return task
 
     def schedule_task(self, name: str, command: str, scheduled_at: datetime,
                      arguments: Dict[str, Any] = {}, description: Optional[str] = None,
                      priority: TaskPriority = TaskPriority.NORMAL, tags: List[str] = []) -> AsyncTask:
         tasks = self._read_tasks()
-        new_id = max([t.id for t in tasks if t.id is not None] + [0]) + 1
+        new_id = max((t.id for t in tasks if t.id is not None), default=0) + 1
         task = AsyncTask(
             id=new_id,
             name=name,
@@ -121,18 +126,22 @@ class AsyncTasksTool(BaseTool):
             tags=tags,
             created_at=datetime.now(),
         )
-        with open(self.data_file, 'a') as f:
+        with open(self.data_file, 'a', encoding='utf-8') as f:
             f.write(task.json() + '\n')
+        self._invalidate_cache()
         return task
 
     def list_tasks(self, status: Optional[TaskStatus] = None,
                   priority: Optional[TaskPriority] = None, limit: int = 50) -> List[AsyncTask]:
         tasks = self._read_tasks()
-        if status:
-            tasks = [t for t in tasks if t.status == status]
-        if priority:
-            tasks = [t for t in tasks if t.priority == priority]
-        return tasks[:limit]
+        limit = max(limit, 0)
+        if not (status or priority):
+            return tasks[:limit]
+        matches = (
+            t for t in tasks
+            if (not status or t.status == status) and (not priority or t.priority == priority)
+        )
+        return list(islice(matches, limit))
 
     def get_task(self, task_id: int) -> Optional[AsyncTask]:
         tasks = self._read_tasks()
@@ -144,11 +153,13 @@ class AsyncTasksTool(BaseTool):
     def cancel_task(self, task_id: int) -> bool:
         tasks = self._read_tasks()
         updated = False
+        new_tasks = []
         for t in tasks:
             if t.id == task_id:
-                t.status = TaskStatus.CANCELLED
+                t = t.model_copy(update={'status': TaskStatus.CANCELLED})
                 updated = True
-        self._write_tasks(tasks)
+            new_tasks.append(t)
+        self._write_tasks(new_tasks)
         return updated
 
     def get_task_status(self, task_id: int) -> Optional[Dict[str, Any]]:
@@ -164,7 +175,7 @@ class AsyncTasksTool(BaseTool):
     def get_task_history(self, days: int = 7) -> List[AsyncTask]:
         tasks = self._read_tasks()
         cutoff = datetime.now() - timedelta(days=days)
-        return [t for t in tasks if t.created_at and datetime.fromisoformat(str(t.created_at)) >= cutoff]
+        return [t for t in tasks if t.created_at and t.created_at >= cutoff]
     
     async def _worker(self):
         """Background worker that processes the task queue."""
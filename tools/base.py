@@ -2,9 +2,12 @@
 Base tool interface for Emily Tools MCP server.
 """
 
+import locale
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
+
+T = TypeVar("T")
 
 class BaseTool(ABC):
     """Base class for all tools in the Emily Tools server."""
@@ -12,6 +15,10 @@ class BaseTool(ABC):
     def __init__(self, data_dir: Path):
         self.data_dir = data_dir
         self.data_file = data_dir / f"{self.name}.jsonl"
+        # Parsed contents of data_file keyed by (write version, mtime, size);
+        # writes through the tool bump the version, external edits change the stat.
+        self._data_version = 0
+        self._data_cache: Optional[Tuple[Tuple[int, int, int], Any]] = None
     
     @property
     @abstractmethod
@@ -40,6 +47,35 @@ class BaseTool(ABC):
         """Cleanup resources when the tool is shut down."""
         pass
     
+    def _cached_read(self, load: Callable[[], T]) -> T:
+        """Return the parsed data file, calling load() only when it has changed."""
+        stat = self.data_file.stat()
+        key = (self._data_version, stat.st_mtime_ns, stat.st_size)
+        if self._data_cache is not None and self._data_cache[0] == key:
+            return cast(T, self._data_cache[1])
+        data = load()
+        self._data_cache = (key, data)
+        return data
+
+    def _read_lines(self) -> List[str]:
+        """Return the lines of data_file, which the tools write as UTF-8.
+
+        Files written before writes were pinned to UTF-8 used the locale
+        encoding, so fall back to it when the bytes aren't valid UTF-8.
+        """
+        data = self.data_file.read_bytes()
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            text = data.decode(locale.getpreferredencoding(False))
+        # Split on newlines only; str.splitlines() would also break records on U+2028 and friends
+        return text.split('\n')
+
+    def _invalidate_cache(self) -> None:
+        """Drop the parsed data file after writing to it."""
+        self._data_version += 1
+        self._data_cache = None
+
     def get_tool_functions(self) -> List[Dict[str, Any]]:
         """Get MCP tool function definitions for this tool."""
         return [] 
@@ -4,13 +4,13 @@ Calendar tool for Emily Tools MCP server.
 
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
 from ..base import BaseTool
-import json
 
 
 class EventType(str, Enum):
@@ -61,13 +61,17 @@ class CalendarTool(BaseTool):
     def _read_events(self) -> List[Event]:
         if not self.data_file.exists():
             return []
-        with open(self.data_file, 'r') as f:
-            return [Event(**json.loads(line)) for line in f if line.strip()]
+        return self._cached_read(self._load_events)
+
+    def _load_events(self) -> List[Event]:
+        lines = self._read_lines()
+        return [Event.model_validate_json(line) for line in lines if line and not line.isspace()]
 
     def _write_events(self, events: List[Event]):
-        with open(self.data_file, 'w') as f:
-            for event in events:
-                f.write(event.json() + '\n')
+        content = ''.join(event.json() + '\n' for event in events)
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self._invalidate_cache()
 
     def create_event(self, title: str, start_time: str, end_time: Optional[str] = None,
                     description: Optional[str] = None, event_type: EventType = EventType.OTHER,
@@ -75,7 +79,7 @@ class CalendarTool(BaseTool):
                     is_all_day: bool = False, tags: List[str] = []) -> Event:
         """Create a new calendar event and append to JSONL."""
         events = self._read_events()
-        new_id = max([e.id for e in events if e.id is not None] + [0]) + 1
+        new_id = max((e.id for e in events if e.id is not None), default=0) + 1
         event = Event(
             id=new_id,
             title=title,
@@ -89,15 +93,17 @@ class CalendarTool(BaseTool):
             created_at=datetime.now(),
             tags=tags,
         )
-        with open(self.data_file, 'a') as f:
+        with open(self.data_file, 'a', encoding='utf-8') as f:
             f.write(event.json() + '\n')
+        self._invalidate_cache()
         return event
 
     def list_events(self, event_type: Optional[EventType] = None,
                    limit: int = 50) -> List[Event]:
         events = self._read_events()
+        limit = max(limit, 0)
         if event_type:
-            events = [e for e in events if e.event_type == event_type]
+            return list(islice((e for e in events if e.event_type == event_type), limit))
         return events[:limit]
 
     def get_event(self, event_id: int) -> Optional[Event]:
@@ -110,12 +116,16 @@ class CalendarTool(BaseTool):
     def update_event(self, event_id: int, **kwargs) -> Optional[Event]:
         events = self._read_events()
         updated = None
+        new_events = []
         for e in events:
             if e.id == event_id:
+                # Edit a copy so a failed update leaves the cached events untouched
+                e = e.model_copy()
                 for k, v in kwargs.items():
                     setattr(e, k, v)
                 updated = e
-        self._write_events(events)
+            new_events.append(e)
+        self._write_events(new_events)
         return updated
 
     def delete_event(self, event_id: int) -> bool:
@@ -126,19 +136,22 @@ class CalendarTool(BaseTool):
 
     def search_events(self, query: str) -> List[Event]:
         events = self._read_events()
-        return [e for e in events if query.lower() in e.title.lower() or (e.description and query.lower() in e.description.lower())]
+        if not query:
+            return list(events)
+        query = query.lower()
+        return [e for e in events if query in e.title.lower() or (e.description and query in e.description.lower())]
 
     def get_upcoming_events(self, days: int = 7) -> List[Event]:
         events = self._read_events()
         now = datetime.now()
         future = now + timedelta(days=days)
-        return [e for e in events if e.start_time and now <= datetime.fromisoformat(str(e.start_time)) <= future]
+        return [e for e in events if e.start_time and now <= e.start_time <= future]
 
     def get_events_by_date_range(self, start_date: str, end_date: str) -> List[Event]:
         events = self._read_events()
         start = datetime.fromisoformat(start_date)
         end = datetime.fromisoformat(end_date)
-        return [e for e in events if e.start_time and start <= datetime.fromisoformat(str(e.start_time)) <= end]
+        return [e for e in events if e.start_time and start <= e.start_time <= end]
     
     def _row_to_event(self, row) -> Event:
         """Convert database row to Event object."""
@@ -156,6 +169,21 @@ class CalendarTool(BaseTool):
             tags=row[10].split(',') if row[10] else []
         ) 
 
+    def _event_to_dict(self, event: Event) -> Dict[str, Any]:
+        """Convert an Event to the dict shape returned by the MCP tools."""
+        return {
+            "id": event.id,
+            "title": event.title,
+            "description": event.description,
+            "event_type": event.event_type.value,
+            "start_time": event.start_time.isoformat(),
+            "end_time": event.end_time.isoformat() if event.end_time else None,
+            "location": event.location,
+            "attendees": event.attendees,
+            "is_all_day": event.is_all_day,
+            "tags": event.tags
+        }
+
     def register(self, mcp):
         @mcp.tool()
         async def calendar_create_event(title: str, start_time: str, end_time: str = None,
@@ -179,39 +207,14 @@ class CalendarTool(BaseTool):
                 is_all_day=is_all_day,
                 tags=tags
             )
-            return {
-                "id": event.id,
-                "title": event.title,
-                "description": event.description,
-                "event_type": event.event_type.value,
-                "start_time": event.start_time.isoformat(),
-                "end_time": event.end_time.isoformat() if event.end_time else None,
-                "location": event.location,
-                "attendees": event.attendees,
-                "is_all_day": event.is_all_day,
-                "tags": event.tags
-            }
+            return self._event_to_dict(event)
 
         @mcp.tool()
         async def calendar_list_events(event_type: str = None, limit: int = 50, ctx: object = None) -> list:
             """List calendar events with optional filtering."""
             event_type_enum = EventType(event_type.lower()) if event_type else None
             events = self.list_events(event_type=event_type_enum, limit=limit)
-            return [
-                {
-                    "id": event.id,
-                    "title": event.title,
-                    "description": event.description,
-                    "event_type": event.event_type.value,
-                    "start_time": event.start_time.isoformat(),
-                    "end_time": event.end_time.isoformat() if event.end_time else None,
-                    "location": event.location,
-                    "attendees": event.attendees,
-                    "is_all_day": event.is_all_day,
-                    "tags": event.tags
-                }
-                for event in events
-            ]
+            return [self._event_to_dict(event) for event in events]
 
         @mcp.tool()
         async def calendar_get_upcoming_events(days: int = 7, ctx: object = None) -> list:
@@ -2,7 +2,9 @@
 Handoff tool for Emily Tools MCP server.
 """
 
+import heapq
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -37,24 +39,29 @@ class HandoffTool(BaseTool):
     def _read_contexts(self) -> List[HandoffContext]:
         if not self.data_file.exists():
             return []
-        with open(self.data_file, 'r') as f:
-            return [HandoffContext(**json.loads(line)) for line in f if line.strip()]
+        return self._cached_read(self._load_contexts)
+
+    def _load_contexts(self) -> List[HandoffContext]:
+        lines = self._read_lines()
+        return [HandoffContext.model_validate_json(line) for line in lines if line and not line.isspace()]
 
     def _write_contexts(self, contexts: List[HandoffContext]):
-        with open(self.data_file, 'w') as f:
-            for ctx in contexts:
-                f.write(ctx.json() + '\n')
+        content = ''.join(ctx.json() + '\n' for ctx in contexts)
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self._invalidate_cache()
 
     def save_context(self, context: str) -> HandoffContext:
         contexts = self._read_contexts()
-        new_id = max([c.id for c in contexts if c.id is not None] + [0]) + 1
+        new_id = max((c.id for c in contexts if c.id is not None), default=0) + 1
         ctx = HandoffContext(
             id=new_id,
             context=context,
             created_at=datetime.now(),
         )
-        with open(self.data_file, 'a') as f:
+        with open(self.data_file, 'a', encoding='utf-8') as f:
             f.write(ctx.json() + '\n')
+        self._invalidate_cache()
         return ctx
 
     def get_latest_context(self) -> Optional[HandoffContext]:
@@ -65,43 +72,36 @@ class HandoffTool(BaseTool):
 
     def list_contexts(self, limit: int = 10) -> List[HandoffContext]:
         contexts = self._read_contexts()
-        return sorted(contexts, key=lambda c: c.created_at, reverse=True)[:limit]
+        return heapq.nlargest(max(limit, 0), contexts, key=attrgetter('created_at'))
+
+    def _context_to_dict(self, ctx: HandoffContext) -> Dict[str, Any]:
+        """Convert a HandoffContext to the dict shape returned by the MCP tools."""
+        return {
+            "id": ctx.id,
+            "context": ctx.context,
+            "created_at": ctx.created_at.isoformat(),
+        }
 
     def register(self, mcp):
         @mcp.tool()
         async def handoff_save(context: str) -> dict:
             """Save chat context for handoff between sessions."""
             saved = self.save_context(context)
-            return {
-                "id": saved.id,
-                "context": saved.context,
-                "created_at": saved.created_at.isoformat(),
-            }
+            return self._context_to_dict(saved)
 
         @mcp.tool()
         async def handoff_get() -> dict:
             """Get the latest saved chat context."""
             latest = self.get_latest_context()
             if latest:
-                return {
-                    "id": latest.id,
-                    "context": latest.context,
-                    "created_at": latest.created_at.isoformat(),
-                }
+                return self._context_to_dict(latest)
             return {}
 
         @mcp.tool()
         async def handoff_list(limit: int = 10) -> list:
             """List recent saved chat contexts."""
             contexts = self.list_contexts(limit=limit)
-            return [
-                {
-                    "id": c.id,
-                    "context": c.context,
-                    "created_at": c.created_at.isoformat(),
-                }
-                for c in contexts
-            ]
+            return [self._context_to_dict(c) for c in contexts]
 
         @mcp.resource("resource://handoff/recent")
         def handoff_recent() -> str:
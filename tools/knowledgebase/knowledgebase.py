@@ -3,7 +3,9 @@ Codebase Knowledgebase tool for Emily Tools MCP server.
 """
 
 import json
+from collections import defaultdict
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -66,22 +68,30 @@ class KnowledgebaseTool(BaseTool):
             "query_knowledge_graph"
         ]
     
-    def _read_entries(self) -> List[Dict[str, Any]]:
+    def _read_entries(self, entry_type: str) -> List[Dict[str, Any]]:
         if not self.data_file.exists():
             return []
-        with open(self.data_file, 'r') as f:
-            return [json.loads(line) for line in f if line.strip()]
+        return self._cached_read(self._load_entries).get(entry_type, [])
+
+    def _load_entries(self) -> Dict[Optional[str], List[Dict[str, Any]]]:
+        # Bucket by entry type while parsing so lookups never rescan other kinds
+        entries: Dict[Optional[str], List[Dict[str, Any]]] = defaultdict(list)
+        for line in self._read_lines():
+            if line and not line.isspace():
+                entry = json.loads(line)
+                entries[entry.get('type')].append(entry)
+        return dict(entries)
 
     def _write_entries(self, entries: List[Dict[str, Any]]):
-        with open(self.data_file, 'w') as f:
-            for entry in entries:
-                f.write(json.dumps(entry) + '\n')
+        content = ''.join(json.dumps(entry) + '\n' for entry in entries)
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self._invalidate_cache()
 
     def register_codebase(self, codebase_id: str, name: str, root_path: str, 
                          description: Optional[str] = None) -> Codebase:
-        entries = self._read_entries()
-        for entry in entries:
-            if entry.get('type') == 'codebase' and entry['id'] == codebase_id:
+        for entry in self._read_entries('codebase'):
+            if entry['id'] == codebase_id:
                 return Codebase(**entry)
         codebase = Codebase(
             id=codebase_id,
@@ -90,15 +100,16 @@ class KnowledgebaseTool(BaseTool):
             description=description,
             created_at=datetime.now(),
         )
-        with open(self.data_file, 'a') as f:
+        with open(self.data_file, 'a', encoding='utf-8') as f:
             f.write(json.dumps({**codebase.dict(), 'type': 'codebase'}) + '\n')
+        self._invalidate_cache()
         return codebase
 
     def add_knowledge_node(self, codebase_id: str, node_type: str, name: str, 
                           content: str, path: Optional[str] = None,
                           metadata: Dict[str, Any] = {}) -> KnowledgeNode:
-        entries = self._read_entries()
-        new_id = max([e.get('id', 0) for e in entries if e.get('type') == 'node'] + [0]) + 1
+        new_id = max((e.get('id', 0) for e in self._read_entries('node')), default=0) + 1
+        now = datetime.now()
         node = KnowledgeNode(
             id=new_id,
             codebase_id=codebase_id,
@@ -107,17 +118,17 @@ class KnowledgebaseTool(BaseTool):
             content=content,
             path=path,
             metadata=metadata,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
-        with open(self.data_file, 'a') as f:
+        with open(self.data_file, 'a', encoding='utf-8') as f:
             f.write(json.dumps({**node.dict(), 'type': 'node'}) + '\n')
+        self._invalidate_cache()
         return node
 
     def add_knowledge_relation(self, source_node_id: int, target_node_id: int,
                               relation_type: str, metadata: Dict[str, Any] = {}) -> KnowledgeRelation:
-        entries = self._read_entries()
-        new_id = max([e.get('id', 0) for e in entries if e.get('type') == 'relation'] + [0]) + 1
+        new_id = max((e.get('id', 0) for e in self._read_entries('relation')), default=0) + 1
         relation = KnowledgeRelation(
             id=new_id,
             source_node_id=source_node_id,
@@ -126,50 +137,53 @@ class KnowledgebaseTool(BaseTool):
             metadata=metadata,
             created_at=datetime.now(),
         )
-        with open(self.data_file, 'a') as f:
+        with open(self.data_file, 'a', encoding='utf-8') as f:
             f.write(json.dumps({**relation.dict(), 'type': 'relation'}) + '\n')
+        self._invalidate_cache()
         return relation
 
     def search_nodes(self, query: str, codebase_id: Optional[str] = None, node_type: Optional[str] = None, limit: int = 50) -> List[KnowledgeNode]:
-        entries = self._read_entries()
-        nodes = [e for e in entries if e.get('type') == 'node']
+        # Chained generators so the scan stops once `limit` nodes have matched
+        nodes = iter(self._read_entries('node'))
         if codebase_id:
-            nodes = [n for n in nodes if n['codebase_id'] == codebase_id]
+            nodes = (n for n in nodes if n['codebase_id'] == codebase_id)
         if node_type:
-            nodes = [n for n in nodes if n['node_type'] == node_type]
-        results = [n for n in nodes if query.lower() in n['name'].lower() or query.lower() in n['content'].lower()]
-        return [KnowledgeNode(**n) for n in results[:limit]]
+            nodes = (n for n in nodes if n['node_type'] == node_type)
+        if query:
+            query = query.lower()
+            nodes = (n for n in nodes if query in n['name'].lower() or query in n['content'].lower())
+        return [KnowledgeNode(**n) for n in islice(nodes, max(limit, 0))]
 
     def get_node(self, node_id: int) -> Optional[KnowledgeNode]:
-        entries = self._read_entries()
-        for n in entries:
-            if n.get('type') == 'node' and n['id'] == node_id:
+        for n in self._read_entries('node'):
+            if n['id'] == node_id:
                 return KnowledgeNode(**n)
         return None
 
     def get_related_nodes(self, node_id: int, relation_type: Optional[str] = None, direction: str = "both") -> List[Dict[str, Any]]:
-        entries = self._read_entries()
-        relations = [e for e in entries if e.get('type') == 'relation']
-        if relation_type:
-            relations = [r for r in relations if r['relation_type'] == relation_type]
-        if direction == "out":
-            rels = [r for r in relations if r['source_node_id'] == node_id]
-        elif direction == "in":
-            rels = [r for r in relations if r['target_node_id'] == node_id]
-        else:
-            rels = [r for r in relations if r['source_node_id'] == node_id or r['target_node_id'] == node_id]
-        node_ids = set([r['source_node_id'] for r in rels] + [r['target_node_id'] for r in rels])
-        nodes = [n for n in entries if n.get('type') == 'node' and n['id'] in node_ids]
+        node_ids = set()
+        for r in self._read_entries('relation'):
+            if relation_type and r['relation_type'] != relation_type:
+                continue
+            source, target = r['source_node_id'], r['target_node_id']
+            if direction == "out":
+                matched = source == node_id
+            elif direction == "in":
+                matched = target == node_id
+            else:
+                matched = source == node_id or target == node_id
+            if matched:
+                node_ids.add(source)
+                node_ids.add(target)
+        nodes = [n for n in self._read_entries('node') if n['id'] in node_ids]
         return nodes
 
     def list_codebases(self) -> List[Codebase]:
-        entries = self._read_entries()
-        return [Codebase(**e) for e in entries if e.get('type') == 'codebase']
+        return [Codebase(**e) for e in self._read_entries('codebase')]
 
     def get_codebase_info(self, codebase_id: str) -> Optional[Codebase]:
-        entries = self._read_entries()
-        for e in entries:
-            if e.get('type') == 'codebase' and e['id'] == codebase_id:
+        for e in self._read_entries('codebase'):
+            if e['id'] == codebase_id:
                 return Codebase(**e)
         return None
 
@@ -178,6 +192,18 @@ class KnowledgebaseTool(BaseTool):
         nodes = self.search_nodes(query, codebase_id)
         return {'nodes': [n.dict() for n in nodes]} 
 
+    def _node_to_dict(self, node: KnowledgeNode) -> Dict[str, Any]:
+        """Convert a KnowledgeNode to the dict shape returned by the MCP tools."""
+        return {
+            "id": node.id,
+            "codebase_id": node.codebase_id,
+            "node_type": node.node_type,
+            "name": node.name,
+            "content": node.content,
+            "path": node.path,
+            "metadata": node.metadata
+        }
+
     def register(self, mcp):
         @mcp.tool()
         async def codebase_register(codebase_id: str, name: str, root_path: str, 
@@ -211,15 +237,7 @@ class KnowledgebaseTool(BaseTool):
                 path=path,
                 metadata=metadata
             )
-            return {
-                "id": node.id,
-                "codebase_id": node.codebase_id,
-                "node_type": node.node_type,
-                "name": node.name,
-                "content": node.content,
-                "path": node.path,
-                "metadata": node.metadata
-            }
+            return self._node_to_dict(node)
 
         @mcp.tool()
         async def codebase_search(query: str, codebase_id: str = None, 
@@ -231,18 +249,7 @@ class KnowledgebaseTool(BaseTool):
                 node_type=node_type,
                 limit=limit
             )
-            return [
-                {
-                    "id": node.id,
-                    "codebase_id": node.codebase_id,
-                    "node_type": node.node_type,
-                    "name": node.name,
-                    "content": node.content,
-                    "path": node.path,
-                    "metadata": node.metadata
-                }
-                for node in nodes
-            ]
+            return [self._node_to_dict(node) for node in nodes]
 
         @mcp.resource("resource://knowledgebase/all")
         def resource_knowledgebase_all() -> list:
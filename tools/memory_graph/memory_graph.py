@@ -1,11 +1,39 @@
 import json
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from ..base import BaseTool
 
+SEARCH_CACHE_SIZE = 128
+
+
+def _unhashable(value: Any) -> bool:
+    """JSON objects and arrays can't go in a set; they are compared by equality instead."""
+    return isinstance(value, (dict, list))
+
+
+class _Members:
+    """Membership test over untyped MCP values: a set for hashable ones, equality for the rest."""
+
+    def __init__(self, values: List[Any]):
+        self._hashable = {v for v in values if not _unhashable(v)}
+        self._unhashable = [v for v in values if _unhashable(v)]
+
+    def __contains__(self, value: Any) -> bool:
+        if _unhashable(value):
+            return value in self._unhashable
+        return value in self._hashable
+
+
 class MemoryGraphTool(BaseTool):
     """Memory graph tool using JSONL for persistent storage of entities, relations, and observations."""
 
+    def __init__(self, data_dir: Path):
+        super().__init__(data_dir)
+        # Search results for the graph object they were computed from
+        self._search_graph: Optional[List[Dict[str, Any]]] = None
+        self._search_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+
     @property
     def name(self) -> str:
         return "memory_graph"
@@ -30,62 +58,113 @@ class MemoryGraphTool(BaseTool):
     def _read_graph(self) -> List[Dict[str, Any]]:
         if not self.data_file.exists():
             return []
-        with open(self.data_file, 'r') as f:
-            return [json.loads(line) for line in f if line.strip()]
+        return self._cached_read(self._load_graph)
+
+    def _load_graph(self) -> List[Dict[str, Any]]:
+        lines = self._read_lines()
+        return [json.loads(line) for line in lines if line and not line.isspace()]
 
     def _write_graph(self, entries: List[Dict[str, Any]]):
-        with open(self.data_file, 'w') as f:
-            for entry in entries:
-                f.write(json.dumps(entry) + '\n')
+        content = ''.join(json.dumps(entry) + '\n' for entry in entries)
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self._invalidate_cache()
 
     def create_entities(self, entities: List[Dict[str, Any]]):
         graph = self._read_graph()
         existing_names = {e['name'] for e in graph if e.get('type') == 'entity'}
-        new_entities = [e for e in entities if e['name'] not in existing_names]
-        for entity in new_entities:
-            entity['type'] = 'entity'
-        with open(self.data_file, 'a') as f:
-            for entity in new_entities:
-                f.write(json.dumps(entity) + '\n')
+        new_entities = []
+        for entity in entities:
+            if entity['name'] not in existing_names:
+                existing_names.add(entity['name'])
+                entity['type'] = 'entity'
+                new_entities.append(entity)
+        if new_entities:
+            content = ''.join(json.dumps(entity) + '\n' for entity in new_entities)
+            with open(self.data_file, 'a', encoding='utf-8') as f:
+                f.write(content)
+            self._invalidate_cache()
         return new_entities
 
     def create_relations(self, relations: List[Dict[str, Any]]):
         graph = self._read_graph()
         existing = {(r['from'], r['to'], r['relationType']) for r in graph if r.get('type') == 'relation'}
-        new_relations = [r for r in relations if (r['from'], r['to'], r['relationType']) not in existing]
-        for rel in new_relations:
-            rel['type'] = 'relation'
-        with open(self.data_file, 'a') as f:
-            for rel in new_relations:
-                f.write(json.dumps(rel) + '\n')
+        new_relations = []
+        for rel in relations:
+            key = (rel['from'], rel['to'], rel['relationType'])
+            if key not in existing:
+                existing.add(key)
+                rel['type'] = 'relation'
+                new_relations.append(rel)
+        if new_relations:
+            content = ''.join(json.dumps(rel) + '\n' for rel in new_relations)
+            with open(self.data_file, 'a', encoding='utf-8') as f:
+                f.write(content)
+            self._invalidate_cache()
         return new_relations
 
+    def _entity_positions(self, graph: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+        index: Dict[str, List[int]] = {}
+        for i, entry in enumerate(graph):
+            if entry.get('type') == 'entity' and not _unhashable(entry['name']):
+                index.setdefault(entry['name'], []).append(i)
+        return index
+
+    def _positions_of(self, positions: Dict[str, List[int]], name: Any) -> List[int]:
+        # Untyped MCP input may pass entity objects instead of names; those match nothing
+        if _unhashable(name):
+            return []
+        return positions.get(name, [])
+
     def add_observations(self, observations: List[Dict[str, Any]]):
-        graph = self._read_graph()
+        # Edit copies of the touched entries so a failed call leaves the cached graph untouched
+        graph = list(self._read_graph())
+        positions = self._entity_positions(graph)
+        copied = set()
         updated = []
         for obs in observations:
-            for entry in graph:
-                if entry.get('type') == 'entity' and entry['name'] == obs['entityName']:
-                    entry.setdefault('observations', [])
-                    for o in obs['contents']:
-                        if o not in entry['observations']:
-                            entry['observations'].append(o)
-                    updated.append(entry)
+            for i in self._positions_of(positions, obs['entityName']):
+                if i not in copied:
+                    graph[i] = {**graph[i], 'observations': list(graph[i].get('observations', ()))}
+                    copied.add(i)
+                entry = graph[i]
+                existing = entry['observations']
+                seen = {o for o in existing if not _unhashable(o)}
+                for o in obs['contents']:
+                    if _unhashable(o):
+                        if o in existing:
+                            continue
+                    elif o in seen:
+                        continue
+                    else:
+                        seen.add(o)
+                    existing.append(o)
+                updated.append(entry)
         self._write_graph(graph)
         return updated
 
     def delete_entities(self, entity_names: List[str]):
         graph = self._read_graph()
-        new_graph = [e for e in graph if not (e.get('type') == 'entity' and e['name'] in entity_names)]
-        new_graph = [e for e in new_graph if not (e.get('type') == 'relation' and (e['from'] in entity_names or e['to'] in entity_names))]
+        names = _Members(entity_names)
+        new_graph = [
+            e for e in graph
+            if not (e.get('type') == 'entity' and e['name'] in names)
+            and not (e.get('type') == 'relation' and (e['from'] in names or e['to'] in names))
+        ]
         self._write_graph(new_graph)
 
     def delete_observations(self, deletions: List[Dict[str, Any]]):
-        graph = self._read_graph()
+        graph = list(self._read_graph())
+        positions = self._entity_positions(graph)
         for deletion in deletions:
-            for entry in graph:
-                if entry.get('type') == 'entity' and entry['name'] == deletion['entityName']:
-                    entry['observations'] = [o for o in entry.get('observations', []) if o not in deletion['observations']]
+            to_delete = {o for o in deletion['observations'] if not _unhashable(o)}
+            to_delete_unhashable = [o for o in deletion['observations'] if _unhashable(o)]
+            for i in self._positions_of(positions, deletion['entityName']):
+                entry = graph[i]
+                graph[i] = {**entry, 'observations': [
+                    o for o in entry.get('observations', ())
+                    if not (o in to_delete_unhashable if _unhashable(o) else o in to_delete)
+                ]}
         self._write_graph(graph)
 
     def delete_relations(self, relations: List[Dict[str, Any]]):
@@ -95,23 +174,44 @@ class MemoryGraphTool(BaseTool):
         self._write_graph(new_graph)
 
     def read_graph(self) -> List[Dict[str, Any]]:
-        return self._read_graph()
+        return list(self._read_graph())
 
     def search_nodes(self, query: str) -> List[Dict[str, Any]]:
         graph = self._read_graph()
+        query = query.lower()
+        if self._search_graph is not graph:
+            self._search_graph = graph
+            self._search_cache.clear()
+        cached = self._search_cache.get(query)
+        if cached is not None:
+            self._search_cache.move_to_end(query)
+            return list(cached)
         results = []
         for entry in graph:
             if entry.get('type') == 'entity':
-                if query.lower() in entry['name'].lower() or \
-                   query.lower() in entry.get('entityType', '').lower() or \
-                   any(query.lower() in o.lower() for o in entry.get('observations', [])):
+                if not query or \
+                   query in entry['name'].lower() or \
+                   query in entry.get('entityType', '').lower() or \
+                   any(query in o.lower() for o in entry.get('observations', ())):
                     results.append(entry)
-        return results
+        self._search_cache[query] = results
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return list(results)
 
     def open_nodes(self, names: List[str]) -> List[Dict[str, Any]]:
         graph = self._read_graph()
-        nodes = [e for e in graph if e.get('type') == 'entity' and e['name'] in names]
-        relations = [e for e in graph if e.get('type') == 'relation' and (e['from'] in names or e['to'] in names)]
+        wanted = _Members(names)
+        nodes = []
+        relations = []
+        for e in graph:
+            kind = e.get('type')
+            if kind == 'entity':
+                if e['name'] in wanted:
+                    nodes.append(e)
+            elif kind == 'relation':
+                if e['from'] in wanted or e['to'] in wanted:
+                    relations.append(e)
         return nodes + relations
 
     def register(self, mcp):
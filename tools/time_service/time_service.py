@@ -77,12 +77,14 @@ class TimeServiceTool(BaseTool):
     def get_timezone_info(self) -> Dict[str, Any]:
         """Get current timezone information."""
         now = datetime.now()
+        local_now = now.astimezone()
         utc_now = datetime.now(timezone.utc)
+        dst = local_now.dst()
         
         return {
-            "local_timezone": str(now.astimezone().tzinfo),
-            "utc_offset": now.astimezone().utcoffset().total_seconds() / 3600,
-            "is_dst": now.astimezone().dst().total_seconds() > 0 if now.astimezone().dst() else False,
+            "local_timezone": str(local_now.tzinfo),
+            "utc_offset": local_now.utcoffset().total_seconds() / 3600,
+            "is_dst": dst.total_seconds() > 0 if dst else False,
             "utc_time": utc_now.isoformat(),
             "local_time": now.isoformat()
         }
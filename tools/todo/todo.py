@@ -2,6 +2,7 @@
 TODO List tool for Emily Tools MCP server.
 """
 
+from collections import Counter
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
@@ -10,7 +11,6 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 
 from ..base import BaseTool
-import json
 
 
 class Priority(str, Enum):
@@ -64,20 +64,24 @@ class TodoTool(BaseTool):
     def _read_tasks(self) -> List[Task]:
         if not self.data_file.exists():
             return []
-        with open(self.data_file, 'r') as f:
-            return [Task(**json.loads(line)) for line in f if line.strip()]
+        return self._cached_read(self._load_tasks)
+
+    def _load_tasks(self) -> List[Task]:
+        lines = self._read_lines()
+        return [Task.model_validate_json(line) for line in lines if line and not line.isspace()]
 
     def _write_tasks(self, tasks: List[Task]):
-        with open(self.data_file, 'w') as f:
-            for task in tasks:
-                f.write(task.json() + '\n')
+        content = ''.join(task.json() + '\n' for task in tasks)
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self._invalidate_cache()
 
     def create_task(self, title: str, description: Optional[str] = None, 
                    priority: Priority = Priority.MEDIUM, due_date: Optional[str] = None,
                    tags: List[str] = []) -> Task:
         """Create a new task and append to JSONL."""
         tasks = self._read_tasks()
-        new_id = max([t.id for t in tasks if t.id is not None] + [0]) + 1
+        new_id = max((t.id for t in tasks if t.id is not None), default=0) + 1
         task = Task(
             id=new_id,
             title=title,
@@ -87,28 +91,34 @@ class TodoTool(BaseTool):
             tags=tags,
             created_at=datetime.now(),
         )
-        with open(self.data_file, 'a') as f:
+        with open(self.data_file, 'a', encoding='utf-8') as f:
             f.write(task.json() + '\n')
+        self._invalidate_cache()
         return task
 
     def list_tasks(self, status: Optional[Status] = None, 
                   priority: Optional[Priority] = None) -> List[Task]:
         tasks = self._read_tasks()
-        if status:
-            tasks = [t for t in tasks if t.status == status]
-        if priority:
-            tasks = [t for t in tasks if t.priority == priority]
-        return tasks
+        if not (status or priority):
+            return list(tasks)
+        return [
+            t for t in tasks
+            if (not status or t.status == status) and (not priority or t.priority == priority)
+        ]
 
     def update_task(self, task_id: int, **kwargs) -> Optional[Task]:
         tasks = self._read_tasks()
         updated = None
+        new_tasks = []
         for t in tasks:
             if t.id == task_id:
+                # Edit a copy so a failed update leaves the cached tasks untouched
+                t = t.model_copy()
                 for k, v in kwargs.items():
                     setattr(t, k, v)
                 updated = t
-        self._write_tasks(tasks)
+            new_tasks.append(t)
+        self._write_tasks(new_tasks)
         return updated
 
     def get_task(self, task_id: int) -> Optional[Task]:
@@ -129,16 +139,34 @@ class TodoTool(BaseTool):
 
     def search_tasks(self, query: str) -> List[Task]:
         tasks = self._read_tasks()
-        return [t for t in tasks if query.lower() in t.title.lower() or (t.description and query.lower() in t.description.lower())]
+        if not query:
+            return list(tasks)
+        query = query.lower()
+        return [t for t in tasks if query in t.title.lower() or (t.description and query in t.description.lower())]
 
     def get_statistics(self) -> Dict[str, Any]:
         tasks = self._read_tasks()
+        by_status = Counter(t.status for t in tasks)
+        by_priority = Counter(t.priority for t in tasks)
         return {
             'total': len(tasks),
-            'by_status': {s.value: len([t for t in tasks if t.status == s]) for s in Status},
-            'by_priority': {p.value: len([t for t in tasks if t.priority == p]) for p in Priority},
+            'by_status': {s.value: by_status[s] for s in Status},
+            'by_priority': {p.value: by_priority[p] for p in Priority},
         } 
 
+    def _task_to_dict(self, task: Task) -> Dict[str, Any]:
+        """Convert a Task to the dict shape returned by the MCP tools."""
+        return {
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "priority": task.priority.value,
+            "status": task.status.value,
+            "due_date": task.due_date.isoformat() if task.due_date else None,
+            "tags": task.tags,
+            "created_at": task.created_at.isoformat()
+        }
+
     def register(self, mcp):
         @mcp.tool()
         async def todo_create(title: str, description: str = None, priority: str = "medium", 
@@ -154,15 +182,7 @@ class TodoTool(BaseTool):
                 due_date=due_date,
                 tags=tags
             )
-            return {
-                "id": task.id,
-                "title": task.title,
-                "description": task.description,
-                "priority": task.priority.value,
-                "status": task.status.value,
-                "due_date": task.due_date.isoformat() if task.due_date else None,
-                "tags": task.tags
-            }
+            return self._task_to_dict(task)
 
         @mcp.tool()
         async def todo_list(status: str = None, priority: str = None) -> list:
@@ -170,19 +190,7 @@ class TodoTool(BaseTool):
             status_enum = Status(status.lower()) if status else None
             priority_enum = Priority(priority.lower()) if priority else None
             tasks = self.list_tasks(status=status_enum, priority=priority_enum)
-            return [
-                {
-                    "id": task.id,
-                    "title": task.title,
-                    "description": task.description,
-                    "priority": task.priority.value,
-                    "status": task.status.value,
-                    "due_date": task.due_date.isoformat() if task.due_date else None,
-                    "tags": task.tags,
-                    "created_at": task.created_at.isoformat()
-                }
-                for task in tasks
-            ]
+            return [self._task_to_dict(task) for task in tasks]
 
         @mcp.tool()
         async def todo_complete(task_id: int) -> dict: